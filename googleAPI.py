@@ -147,18 +147,88 @@ def add_content_to_doc(doc_id, content):
         print(f"❌ Error adding content to doc: {err}")
         return False
 
+DOC_MIME_TYPE = 'application/vnd.google-apps.document'
+
+# Existing attachments and tasks, fetched once per event / task list so that
+# reprocessing a recording doesn't insert duplicates. Our own writes keep them
+# up to date, so they live for one run of main.py; anything longer-lived should
+# call reset_dedup_cache() before each run.
+_attachment_cache = {}
+_task_index = {}
+
+def reset_dedup_cache():
+    """Drops the cached attachments and tasks so the next lookup refetches them."""
+    _attachment_cache.clear()
+    _task_index.clear()
+
+def _normalize_title(title):
+    return " ".join((title or "").split()).casefold()
+
+def _normalize_due(due):
+    # Tasks API returns RFC 3339 timestamps; only the date part is meaningful.
+    return due[:10] if due else None
+
+def _parse_deadline(deadline):
+    """Parses a deadline in the formats Gemini tends to return into YYYY-MM-DD."""
+    if not deadline:
+        return None
+    # ISO (2025-10-22), full text (October 22, 2025), US (10/22/2025)
+    for fmt in ("%Y-%m-%d", "%B %d, %Y", "%m/%d/%Y"):
+        try:
+            return datetime.strptime(deadline, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    print(f"Warning: Could not parse deadline '{deadline}', skipping due date")
+    return None
+
+def get_event_attachments(calendar_service, event_id):
+    """Returns the event's attachment list as stored in Calendar, fetching it only once."""
+    if event_id not in _attachment_cache:
+        event = calendar_service.events().get(calendarId='primary', eventId=event_id).execute()
+        _attachment_cache[event_id] = event.get('attachments', [])
+    return _attachment_cache[event_id]
+
+def _find_doc_attachment(attachments, doc_title):
+    """Returns the position of the Google Doc attachment titled doc_title, or None."""
+    key = _normalize_title(doc_title)
+    for i, attachment in enumerate(attachments):
+        if attachment.get('mimeType') == DOC_MIME_TYPE and _normalize_title(attachment.get('title')) == key:
+            return i
+    return None
+
+def has_attachment(event_id, doc_title):
+    """Checks whether the event already has a Google Doc attached under doc_title."""
+    creds = get_credentials()
+    try:
+        calendar_service = build("calendar", "v3", credentials=creds)
+        attachments = get_event_attachments(calendar_service, event_id)
+        return _find_doc_attachment(attachments, doc_title) is not None
+    except HttpError as err:
+        print(f"❌ Error reading event attachments: {err}")
+        return False
+
 def attach_doc_to_event(event_id, doc_url, doc_title):
     creds = get_credentials()
     try:
         calendar_service = build("calendar", "v3", credentials=creds)
-        event = calendar_service.events().get(calendarId='primary', eventId=event_id).execute()
-        existing_attachments = event.get('attachments', [])
+        attachments = get_event_attachments(calendar_service, event_id)
+        position = _find_doc_attachment(attachments, doc_title)
+
+        if position is not None and attachments[position].get('fileUrl') == doc_url:
+            print(f"⏭️ Attachment '{doc_title}' already on event, skipping")
+            return True
+
         new_attachment = {
             'fileUrl': doc_url,
             'title': doc_title,
-            'mimeType': 'application/vnd.google-apps.document'
+            'mimeType': DOC_MIME_TYPE
         }
-        updated_attachments = existing_attachments + [new_attachment]
+        # Swap in our own doc if it's already there; every other attachment is kept as is
+        updated_attachments = list(attachments)
+        if position is not None:
+            updated_attachments[position] = new_attachment
+        else:
+            updated_attachments.append(new_attachment)
         body = {'attachments': updated_attachments}
         calendar_service.events().patch(
             calendarId='primary',
@@ -166,48 +236,71 @@ def attach_doc_to_event(event_id, doc_url, doc_title):
             body=body,
             supportsAttachments=True
         ).execute()
+        _attachment_cache[event_id] = updated_attachments
         return True
     except HttpError as err:
         print(f"❌ Error attaching doc to event: {err}")
         return False
 
+def get_task_index(tasks_service, task_list_id):
+    """Returns the list's tasks indexed by (normalized title, due date), fetching them only once."""
+    if task_list_id not in _task_index:
+        index = {}
+        page_token = None
+        while True:
+            response = tasks_service.tasks().list(
+                tasklist=task_list_id,
+                maxResults=100,
+                showCompleted=True,
+                showHidden=True,
+                fields='nextPageToken, items(id, title, notes, due)',
+                pageToken=page_token
+            ).execute()
+
+            for task in response.get('items', []):
+                index[(_normalize_title(task.get('title')), _normalize_due(task.get('due')))] = task
+
+            page_token = response.get('nextPageToken', None)
+            if page_token is None:
+                break
+        _task_index[task_list_id] = index
+    return _task_index[task_list_id]
+
 def create_task(title, notes="", deadline=None, task_list_id="@default"):
     creds = get_credentials()
     try:
-        # Try to parse the deadline in multiple formats
-        due_date = None
-        if deadline:
-            try:
-                # Try ISO format first (YYYY-MM-DD)
-                deadline1 = datetime.strptime(deadline, "%Y-%m-%d")
-                due_date = deadline1.strftime("%Y-%m-%d")
-            except ValueError:
-                try:
-                    # Try full text format (October 22, 2025)
-                    deadline1 = datetime.strptime(deadline, "%B %d, %Y")
-                    due_date = deadline1.strftime("%Y-%m-%d")
-                except ValueError:
-                    try:
-                        # Try another common format (10/22/2025)
-                        deadline1 = datetime.strptime(deadline, "%m/%d/%Y")
-                        due_date = deadline1.strftime("%Y-%m-%d")
-                    except ValueError:
-                        print(f"Warning: Could not parse deadline '{deadline}', skipping due date")
-                        due_date = None
-        
+        due_date = _parse_deadline(deadline)
+
         tasks_service = build("tasks", "v1", credentials=creds)
+        tasks = get_task_index(tasks_service, task_list_id)
+        key = (_normalize_title(title), due_date)
+
+        existing = tasks.get(key)
+        if existing:
+            # Empty notes never overwrite what's already on the task
+            if not notes or existing.get('notes') == notes:
+                print(f"⏭️ Task already exists: '{title}'")
+                return existing
+            task = tasks_service.tasks().patch(
+                tasklist=task_list_id,
+                task=existing['id'],
+                body={'notes': notes}
+            ).execute()
+            tasks[key] = task
+            print(f"🔄 Task updated: '{title}'")
+            return task
+
         task_body = {'title': title}
         if notes:
             task_body['notes'] = notes
         if due_date:
-            if isinstance(due_date, datetime):
-                due_date = due_date.strftime('%Y-%m-%d')
             task_body['due'] = f"{due_date}T00:00:00.000Z"
         
         task = tasks_service.tasks().insert(
             tasklist=task_list_id,
             body=task_body
         ).execute()
+        tasks[key] = task
         print(f"✅ Task: '{title}'")
         return task
     except HttpError as err:
@@ -134,6 +134,8 @@ if __name__ == "__main__":
     print(f"✅ Found {len(important_task_list_id)} task lists")
     
     
+    googleAPI.reset_dedup_cache()
+
     for folder_id in FOLDERS_ID:
         print(f"\n{'='*60}\n📁 Processing folder: {folder_id[:20]}...\n{'='*60}")
         
@@ -172,6 +174,13 @@ if __name__ == "__main__":
                     PROMPTS = get_prompts(audio_file_path)
                     
                     for i in range(len(PROMPTS)):
+                        if PROMPTS[i]["type"] != "Tasks":
+                            doc_type = "Emociones" if PROMPTS[i]["type"] == "Feelings" else "Resumen"
+                            doc_title = f"{doc_type} {audio_file_path.split('.')[0]}"
+                            if googleAPI.has_attachment(event[2], doc_title):
+                                print(f"⏭️ {doc_type} doc already attached, skipping")
+                                continue
+
                         response = ask(audio_file_path, PROMPTS[i]["prompt"], AI_MODEL, i, PROMPTS[i]["is_structured"]) 
                         
                         if PROMPTS[i]["type"] == "Tasks":
@@ -202,8 +211,7 @@ if __name__ == "__main__":
                                     else:
                                         print("ERROR: University task list not found")
                         else:
-                            doc_type = "Emociones" if PROMPTS[i]["type"] == "Feelings" else "Resumen"
-                            doc_id, doc_url = googleAPI.create_google_doc(f"{doc_type} {audio_file_path.split('.')[0]}")
+                            doc_id, doc_url = googleAPI.create_google_doc(doc_title)
                             
                             if not doc_id:
                                 print(f"❌ Failed to create {doc_type} doc")
@@ -213,7 +221,7 @@ if __name__ == "__main__":
                                 print(f"❌ Failed to add content to {doc_type} doc")
                                 break
 
-                            if googleAPI.attach_doc_to_event(event[2], doc_url, doc_type):
+                            if googleAPI.attach_doc_to_event(event[2], doc_url, doc_title):
                                 print(f"✅ {doc_type} doc attached to calendar event")
                     
                     break